@@ -7,11 +7,15 @@
 
 // ── Config ──────────────────────────────────────────────
 const API_BASE = "http://localhost:8080"; // Relative — works on localhost and Railway
-const POLL_INTERVAL = 10000; // Refresh every 10s
+const POLL_INTERVAL = 10000; // Refresh every 10s when live updates are unavailable
 
 // ── State ───────────────────────────────────────────────
 let employees = [];
 let pollTimer = null;
+let stream = null;
+let streamConnected = false; // Set after the first successful stream open
+let updateSeq = 0; // Bumped on every pushed update
+const pushedAt = new Map(); // employee id -> updateSeq of its latest push
 
 // ── Demo Data (when API is unavailable) ─────────────────
 const DEMO_EMPLOYEES = [
@@ -432,17 +436,27 @@ refreshBtn.addEventListener("click", async () => {
 });
 
 async function refreshData() {
+    const startSeq = updateSeq;
     const data = await fetchEmployees();
+    let detailed = [];
     if (data && data.length > 0) {
-        employees = data;
         // Fetch detailed status for each
-        const detailed = await Promise.all(
+        detailed = await Promise.all(
             data.map(async (emp) => {
                 const status = await fetchEmployeeStatus(emp.id);
                 return status && status.tasks ? { ...emp, tasks: status.tasks } : emp;
             })
         );
-        render(detailed);
+    }
+    // Cards pushed while we were fetching are newer than the snapshot — keep them
+    const pushed = employees.filter((e) => pushedAt.get(e.id) > startSeq);
+    const merged = detailed.map((emp) => pushed.find((e) => e.id === emp.id) || emp);
+    for (const emp of pushed) {
+        if (!merged.some((e) => e.id === emp.id)) merged.push(emp);
+    }
+    if (merged.length > 0) {
+        employees = merged;
+        render(merged);
     } else {
         // Use demo data
         employees = [];
@@ -450,13 +464,46 @@ async function refreshData() {
     }
 }
 
+// ── Live updates ────────────────────────────────────────
+// The server pushes one card per changed employee; polling is only the fallback
+function applyUpdate(emp) {
+    pushedAt.set(emp.id, ++updateSeq);
+    const idx = employees.findIndex((e) => e.id === emp.id);
+    if (idx === -1) employees.push(emp);
+    else employees[idx] = emp;
+    render(employees);
+}
+
+function connectStream() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    stream = new EventSource(`${API_BASE}/api/stream`);
+    stream.onopen = () => {
+        stopPolling();
+        // Reconnected — catch up on anything missed while the stream was down.
+        // The first open directly follows the initial load, so skip it there.
+        if (streamConnected) refreshData();
+        streamConnected = true;
+    };
+    stream.onmessage = (e) => applyUpdate(JSON.parse(e.data));
+    stream.onerror = () => startPolling(); // EventSource keeps retrying meanwhile
+}
+
 // ── Poll ────────────────────────────────────────────────
 function startPolling() {
-    pollTimer = setInterval(refreshData, POLL_INTERVAL);
+    if (!pollTimer) pollTimer = setInterval(refreshData, POLL_INTERVAL);
+}
+
+function stopPolling() {
+    clearInterval(pollTimer);
+    pollTimer = null;
 }
 
 // ── Init ────────────────────────────────────────────────
 document.addEventListener("DOMContentLoaded", async () => {
+    // Connect first: cards pushed during the initial load are merged into it
+    connectStream();
     await refreshData();
-    startPolling();
 });
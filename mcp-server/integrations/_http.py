@@ -0,0 +1,49 @@
+"""Retry handling shared by the HTTP-based integrations (Slack, GitHub)."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+import httpx
+
+MAX_ATTEMPTS = 3
+# Upper bound on a server-requested Retry-After, so one response can't stall a tool call
+MAX_RETRY_DELAY = 30.0
+
+# A 429 means the request was rejected, so any method may be retried. A 502/503
+# doesn't prove the request wasn't applied, so only idempotent methods retry on it
+# (a retried POST could post a duplicate message or issue).
+_RETRY_ANY = frozenset({429})
+_RETRY_IDEMPOTENT = frozenset({429, 502, 503})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+async def send_with_retry(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    method: str,
+    url: str,
+    **kwargs,
+) -> httpx.Response:
+    """Send a request under ``sem``, backing off on retryable status codes."""
+    if method.upper() in _IDEMPOTENT_METHODS:
+        retry_statuses = _RETRY_IDEMPOTENT
+    else:
+        retry_statuses = _RETRY_ANY
+    for attempt in range(MAX_ATTEMPTS):
+        async with sem:
+            resp = await client.request(method, url, **kwargs)
+        if resp.status_code not in retry_statuses or attempt == MAX_ATTEMPTS - 1:
+            return resp
+        await asyncio.sleep(retry_delay(resp, attempt))
+    return resp
+
+
+def retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Honor Retry-After (capped) when given, else exponential backoff with jitter."""
+    try:
+        delay = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 2 ** attempt + random.random()
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
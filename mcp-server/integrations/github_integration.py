@@ -5,11 +5,15 @@ Uses real GitHub API when GITHUB_TOKEN is set, otherwise runs in mock mode.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import logging
 from typing import Optional
 
 import httpx
+import orjson
+
+from ._http import send_with_retry
 
 logger = logging.getLogger("onboard.github")
 
@@ -18,20 +22,79 @@ GITHUB_ORG = os.getenv("GITHUB_ORG", "acme-corp")
 GITHUB_API = "https://api.github.com"
 MOCK_MODE = not GITHUB_TOKEN
 
+# Cap in-flight requests so bulk onboarding doesn't trip secondary rate limits
+_GITHUB_SEM = asyncio.Semaphore(30)
+
+
+_HEADERS = {
+    "Authorization": f"Bearer {GITHUB_TOKEN}",
+    "Accept": "application/vnd.github+json",
+    "Content-Type": "application/json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+
+# ── Message templates ───────────────────────────────────────────────
+
+_ISSUE_BODY_TEMPLATE = """## Welcome {username}! 👋
+
+This issue tracks your development environment setup.
+
+### Checklist
+- [ ] Clone the repository
+- [ ] Install dependencies
+- [ ] Set up local environment variables (see `.env.example`)
+- [ ] Run the test suite
+- [ ] Make your first commit on a feature branch
+- [ ] Open your first PR (can be a small README fix!)
+
+### Resources
+- [Engineering Handbook](https://wiki.acme-corp.dev/handbook)
+- [Git Workflow Guide](https://wiki.acme-corp.dev/git-workflow)
+- [Code Review Guidelines](https://wiki.acme-corp.dev/code-review)
+
+_This issue was auto-created by the Onboarding Agent_ 🤖
+"""
+
+
+# ── Shared HTTP client ──────────────────────────────────────────────
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared GitHub API client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API,
+            headers=_HEADERS,
+            # No explicit transport: it would disable httpx's HTTP(S)_PROXY support
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0),
+        )
+    return _client
+
+
+async def aclose():
+    """Close the shared client (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
-def _headers() -> dict:
-    return {
-        "Authorization": f"Bearer {GITHUB_TOKEN}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+
+async def _request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a GitHub API request under the GitHub semaphore (see ``_http``)."""
+    return await send_with_retry(await get_client(), _GITHUB_SEM, method, url, **kwargs)
 
 
 async def invite_to_org(username: str, org: Optional[str] = None) -> dict:
     """Invite a user to the GitHub organization."""
     org = org or GITHUB_ORG
     if MOCK_MODE:
-        logger.info(f"[MOCK] Invited {username} to GitHub org '{org}'")
+        logger.info("[MOCK] Invited %s to GitHub org '%s'", username, org)
         return {
             "success": True,
             "mock": True,
@@ -39,47 +102,53 @@ async def invite_to_org(username: str, org: Optional[str] = None) -> dict:
             "invitation_id": "mock-inv-001",
         }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.put(
-            f"{GITHUB_API}/orgs/{org}/memberships/{username}",
-            headers=_headers(),
-            json={"role": "member"},
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        logger.info(f"Invited {username} to GitHub org '{org}': {data.get('state')}")
-        return {"success": True, "state": data.get("state"), "role": data.get("role")}
+    resp = await _request(
+        "PUT",
+        f"/orgs/{org}/memberships/{username}",
+        content=orjson.dumps({"role": "member"}),
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    logger.info("Invited %s to GitHub org '%s': %s", username, org, data.get("state"))
+    return {"success": True, "state": data.get("state"), "role": data.get("role")}
 
 
 async def grant_repo_access(
     username: str, repos: list[str], org: Optional[str] = None, permission: str = "push"
 ) -> list[dict]:
-    """Grant a user access to specific repositories."""
+    """Grant a user access to specific repositories (requests run concurrently)."""
     org = org or GITHUB_ORG
-    results = []
+    repos = list(dict.fromkeys(repos))  # One request per distinct repo
 
-    for repo in repos:
+    async def _grant_one(repo: str) -> dict:
         if MOCK_MODE:
-            logger.info(f"[MOCK] Granted {username} '{permission}' on {org}/{repo}")
-            results.append({
+            logger.info("[MOCK] Granted %s '%s' on %s/%s", username, permission, org, repo)
+            return {
                 "repo": repo,
                 "success": True,
                 "mock": True,
                 "permission": permission,
-            })
-            continue
+            }
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.put(
-                f"{GITHUB_API}/repos/{org}/{repo}/collaborators/{username}",
-                headers=_headers(),
-                json={"permission": permission},
-            )
-            resp.raise_for_status()
-            results.append({"repo": repo, "success": True, "permission": permission})
-            logger.info(f"Granted {username} '{permission}' on {org}/{repo}")
+        resp = await _request(
+            "PUT",
+            f"/repos/{org}/{repo}/collaborators/{username}",
+            content=orjson.dumps({"permission": permission}),
+        )
+        resp.raise_for_status()
+        logger.info("Granted %s '%s' on %s/%s", username, permission, org, repo)
+        return {"repo": repo, "success": True, "permission": permission}
 
-    return results
+    results = await asyncio.gather(
+        *(_grant_one(repo) for repo in repos), return_exceptions=True
+    )
+    for repo, r in zip(repos, results):
+        if isinstance(r, Exception):
+            logger.error("Granting %s access to %s/%s failed: %s", username, org, repo, r)
+    return [
+        {"repo": repo, "success": False, "error": str(r)} if isinstance(r, Exception) else r
+        for repo, r in zip(repos, results)
+    ]
 
 
 async def create_setup_issue(
@@ -88,27 +157,8 @@ async def create_setup_issue(
     """Create a 'Dev Environment Setup' issue assigned to the new hire."""
     org = org or GITHUB_ORG
     title = f"🚀 Dev Environment Setup — {username}"
-    body = f"""## Welcome {username}! 👋
-
-This issue tracks your development environment setup.
-
-### Checklist
-- [ ] Clone the repository
-- [ ] Install dependencies
-- [ ] Set up local environment variables (see `.env.example`)
-- [ ] Run the test suite
-- [ ] Make your first commit on a feature branch
-- [ ] Open your first PR (can be a small README fix!)
-
-### Resources
-- [Engineering Handbook](https://wiki.acme-corp.dev/handbook)
-- [Git Workflow Guide](https://wiki.acme-corp.dev/git-workflow)
-- [Code Review Guidelines](https://wiki.acme-corp.dev/code-review)
-
-_This issue was auto-created by the Onboarding Agent_ 🤖
-"""
     if MOCK_MODE:
-        logger.info(f"[MOCK] Created setup issue for {username} in {org}/{repo}")
+        logger.info("[MOCK] Created setup issue for %s in %s/%s", username, org, repo)
         return {
             "success": True,
             "mock": True,
@@ -117,22 +167,42 @@ _This issue was auto-created by the Onboarding Agent_ 🤖
             "url": f"https://github.com/{org}/{repo}/issues/42",
         }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            f"{GITHUB_API}/repos/{org}/{repo}/issues",
-            headers=_headers(),
-            json={
-                "title": title,
-                "body": body,
-                "assignees": [username],
-                "labels": ["onboarding", "good first issue"],
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        return {
-            "success": True,
-            "issue_number": data["number"],
-            "title": data["title"],
-            "url": data["html_url"],
-        }
+    resp = await _request(
+        "POST",
+        f"/repos/{org}/{repo}/issues",
+        content=orjson.dumps({
+            "title": title,
+            "body": _ISSUE_BODY_TEMPLATE.format(username=username),
+            "assignees": [username],
+            "labels": ["onboarding", "good first issue"],
+        }),
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    return {
+        "success": True,
+        "issue_number": data["number"],
+        "title": data["title"],
+        "url": data["html_url"],
+    }
+
+
+async def bootstrap(username: str, repos: list[str], org: Optional[str] = None) -> dict:
+    """Invite to the org, grant repo access and open the setup issue concurrently.
+
+    Returns ``org_invite`` plus, when repos are given, ``repo_access`` and
+    ``setup_issue``. A part that raises comes back as ``{"success": False, "error": ...}``.
+    """
+    calls = {"org_invite": invite_to_org(username, org)}
+    if repos:
+        calls["repo_access"] = grant_repo_access(username, repos, org)
+        calls["setup_issue"] = create_setup_issue(username, repos[0], org)
+
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+    combined = {}
+    for key, r in zip(calls, results):
+        if isinstance(r, Exception):
+            logger.error("GitHub %s failed for %s: %s", key, username, r)
+            r = {"success": False, "error": str(r)}
+        combined[key] = r
+    return combined
@@ -5,11 +5,16 @@ Uses real Slack API when SLACK_BOT_TOKEN is set, otherwise runs in mock mode.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import logging
+import time
 from typing import Optional
 
 import httpx
+import orjson
+
+from ._http import send_with_retry
 
 logger = logging.getLogger("onboard.slack")
 
@@ -17,31 +22,92 @@ SLACK_TOKEN = os.getenv("SLACK_BOT_TOKEN")
 SLACK_API = "https://slack.com/api"
 MOCK_MODE = not SLACK_TOKEN
 
+# Bound concurrent Slack calls so bulk onboarding doesn't flood the API. Per-minute
+# rate limits are enforced by Slack and handled by backing off on 429 Retry-After.
+_SLACK_SEM = asyncio.Semaphore(20)
 
-def _headers() -> dict:
-    return {
-        "Authorization": f"Bearer {SLACK_TOKEN}",
-        "Content-Type": "application/json; charset=utf-8",
-    }
 
+_HEADERS = {
+    "Authorization": f"Bearer {SLACK_TOKEN}",
+    "Content-Type": "application/json; charset=utf-8",
+}
 
-# ── Pre-configured channel map (mock mode) ──────────────────────────
 
-MOCK_CHANNELS = {
-    "#general": "C000GENERAL",
-    "#random": "C000RANDOM",
-    "#engineering": "C000ENGINEER",
-    "#design": "C000DESIGN",
-    "#standup": "C000STANDUP",
-    "#hr": "C000HR",
-    "#announcements": "C000ANNOUNCE",
-    "#onboarding": "C000ONBOARD",
-}
+# ── Shared HTTP client ──────────────────────────────────────────────
 
+_client: Optional[httpx.AsyncClient] = None
 
-async def send_welcome_dm(email: str, name: str, role: str, team: str) -> dict:
-    """Send a personalized welcome DM to the new hire."""
-    message = f"""👋 *Welcome to ACME Corp, {name}!*
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared Slack API client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=SLACK_API,
+            headers=_HEADERS,
+            # No explicit transport: it would disable httpx's HTTP(S)_PROXY support
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=4),
+            timeout=httpx.Timeout(10.0),
+        )
+    return _client
+
+
+async def aclose():
+    """Close the shared client (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a Slack API request under the Slack semaphore (see ``_http``)."""
+    return await send_with_retry(await get_client(), _SLACK_SEM, method, url, **kwargs)
+
+
+# ── User lookup cache ───────────────────────────────────────────────
+# Slack user IDs never change for an email, so successful lookups are kept
+# for an hour to save repeat users.lookupByEmail calls (and rate-limit budget).
+# Concurrent lookups for the same email share a single in-flight request.
+
+_USER_CACHE_TTL = 3600.0
+_USER_CACHE_MAX = 10_000
+_user_cache: dict[str, tuple[str, float]] = {}  # email -> (user_id, expires_at)
+_user_lookups: dict[str, asyncio.Task] = {}  # email -> in-flight lookup
+
+
+async def _lookup_user_id(email: str) -> tuple[Optional[str], Optional[str]]:
+    """Resolve a Slack user ID by email. Returns ``(user_id, error)``."""
+    cached = _user_cache.get(email)
+    if cached and cached[1] > time.monotonic():
+        return cached[0], None
+
+    task = _user_lookups.get(email)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_user_id(email))
+        _user_lookups[email] = task
+        task.add_done_callback(lambda _: _user_lookups.pop(email, None))
+    # Shield so one cancelled caller doesn't cancel the lookup for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_user_id(email: str) -> tuple[Optional[str], Optional[str]]:
+    lookup = await _request("GET", "/users.lookupByEmail", params={"email": email})
+    data = orjson.loads(lookup.content)
+    if not data.get("ok"):
+        return None, data.get("error", "User not found")
+
+    user_id = data["user"]["id"]
+    if len(_user_cache) >= _USER_CACHE_MAX:
+        _user_cache.pop(next(iter(_user_cache)))  # Evict the oldest entry
+    _user_cache[email] = (user_id, time.monotonic() + _USER_CACHE_TTL)
+    return user_id, None
+
+
+# ── Message templates ───────────────────────────────────────────────
+
+_WELCOME_TEMPLATE = """👋 *Welcome to ACME Corp, {name}!*
 
 We're thrilled to have you join the *{team}* team as a *{role}*!
 
@@ -55,8 +121,37 @@ If you need anything at all, just ask me — I'm your friendly Onboarding Bot! 
 
 _Have an amazing first day!_ 🎉"""
 
+_INTRO_TEMPLATE = """🎉 *Everyone, please welcome {name}!*
+
+{name} is joining the *{team}* team as a *{role}*.{fun_line}
+
+Drop a 👋 to say hello!"""
+
+
+# ── Pre-configured channel map (mock mode) ──────────────────────────
+
+MOCK_CHANNELS = {
+    "#general": "C000GENERAL",
+    "#random": "C000RANDOM",
+    "#engineering": "C000ENGINEER",
+    "#design": "C000DESIGN",
+    "#standup": "C000STANDUP",
+    "#hr": "C000HR",
+    "#announcements": "C000ANNOUNCE",
+    "#onboarding": "C000ONBOARD",
+}
+
+# Mock-mode invite results, prebuilt per known channel and copied per call
+_MOCK_INVITE_RESULTS = {
+    name: {"channel": name, "success": True, "mock": True, "channel_id": channel_id}
+    for name, channel_id in MOCK_CHANNELS.items()
+}
+
+
+async def send_welcome_dm(email: str, name: str, role: str, team: str) -> dict:
+    """Send a personalized welcome DM to the new hire."""
     if MOCK_MODE:
-        logger.info(f"[MOCK] Sent welcome DM to {name} ({email})")
+        logger.info("[MOCK] Sent welcome DM to %s (%s)", name, email)
         return {
             "success": True,
             "mock": True,
@@ -65,105 +160,93 @@ _Have an amazing first day!_ 🎉"""
         }
 
     # Look up user by email
-    async with httpx.AsyncClient() as client:
-        lookup = await client.get(
-            f"{SLACK_API}/users.lookupByEmail",
-            headers=_headers(),
-            params={"email": email},
-        )
-        lookup_data = lookup.json()
-        if not lookup_data.get("ok"):
-            return {"success": False, "error": lookup_data.get("error", "User not found")}
-
-        user_id = lookup_data["user"]["id"]
-
-        # Open DM channel
-        conv = await client.post(
-            f"{SLACK_API}/conversations.open",
-            headers=_headers(),
-            json={"users": user_id},
-        )
-        conv_data = conv.json()
-        channel_id = conv_data["channel"]["id"]
-
-        # Send message
-        msg = await client.post(
-            f"{SLACK_API}/chat.postMessage",
-            headers=_headers(),
-            json={"channel": channel_id, "text": message, "mrkdwn": True},
-        )
-        msg_data = msg.json()
-        return {"success": msg_data.get("ok", False), "channel": channel_id}
+    user_id, error = await _lookup_user_id(email)
+    if not user_id:
+        return {"success": False, "error": error}
+
+    # Open DM channel
+    conv = await _request(
+        "POST", "/conversations.open", content=orjson.dumps({"users": user_id})
+    )
+    conv_data = orjson.loads(conv.content)
+    channel_id = conv_data["channel"]["id"]
+
+    # Send message
+    message = _WELCOME_TEMPLATE.format(name=name, role=role, team=team)
+    msg = await _request(
+        "POST",
+        "/chat.postMessage",
+        content=orjson.dumps({"channel": channel_id, "text": message, "mrkdwn": True}),
+    )
+    msg_data = orjson.loads(msg.content)
+    return {"success": msg_data.get("ok", False), "channel": channel_id}
 
 
 async def add_to_channels(email: str, channels: list[str]) -> list[dict]:
-    """Add a user to the specified Slack channels."""
-    results = []
-
-    for channel_name in channels:
+    """Add a user to the specified Slack channels (invites run concurrently)."""
+    user_id = None
+    # Resolve the user once up front rather than once per channel
+    if not MOCK_MODE:
+        user_id, error = await _lookup_user_id(email)
+        if not user_id:
+            return [{"channel": ch, "success": False, "error": error} for ch in channels]
+
+    async def _invite_one(channel_name: str) -> dict:
         if MOCK_MODE:
-            channel_id = MOCK_CHANNELS.get(channel_name, f"C_MOCK_{channel_name}")
-            logger.info(f"[MOCK] Added {email} to {channel_name}")
-            results.append({
+            logger.info("[MOCK] Added %s to %s", email, channel_name)
+            result = _MOCK_INVITE_RESULTS.get(channel_name)
+            if result is not None:
+                return result.copy()
+            return {
                 "channel": channel_name,
                 "success": True,
                 "mock": True,
-                "channel_id": channel_id,
-            })
-            continue
-
-        async with httpx.AsyncClient() as client:
-            # Look up user
-            lookup = await client.get(
-                f"{SLACK_API}/users.lookupByEmail",
-                headers=_headers(),
-                params={"email": email},
-            )
-            user_id = lookup.json().get("user", {}).get("id")
-            if not user_id:
-                results.append({"channel": channel_name, "success": False, "error": "User not found"})
-                continue
-
-            # Invite to channel
-            resp = await client.post(
-                f"{SLACK_API}/conversations.invite",
-                headers=_headers(),
-                json={"channel": channel_name, "users": user_id},
-            )
-            data = resp.json()
-            results.append({
-                "channel": channel_name,
-                "success": data.get("ok", False),
-                "error": data.get("error"),
-            })
+                "channel_id": f"C_MOCK_{channel_name}",
+            }
 
-    return results
+        resp = await _request(
+            "POST",
+            "/conversations.invite",
+            content=orjson.dumps({"channel": channel_name, "users": user_id}),
+        )
+        data = orjson.loads(resp.content)
+        return {
+            "channel": channel_name,
+            "success": data.get("ok", False),
+            "error": data.get("error"),
+        }
+
+    results = await asyncio.gather(
+        *(_invite_one(ch) for ch in channels), return_exceptions=True
+    )
+    for ch, r in zip(channels, results):
+        if isinstance(r, Exception):
+            logger.error("Adding %s to %s failed: %s", email, ch, r)
+    return [
+        {"channel": ch, "success": False, "error": str(r)} if isinstance(r, Exception) else r
+        for ch, r in zip(channels, results)
+    ]
 
 
 async def post_intro(
     channel: str, name: str, role: str, team: str, fun_fact: Optional[str] = None
 ) -> dict:
     """Post an introduction message for the new hire in a channel."""
-    fun_line = f"\n🎯 *Fun fact:* {fun_fact}" if fun_fact else ""
-    message = f"""🎉 *Everyone, please welcome {name}!*
-
-{name} is joining the *{team}* team as a *{role}*.{fun_line}
-
-Drop a 👋 to say hello!"""
-
     if MOCK_MODE:
-        logger.info(f"[MOCK] Posted intro for {name} in {channel}")
+        logger.info("[MOCK] Posted intro for %s in %s", name, channel)
         return {
             "success": True,
             "mock": True,
             "message": f"Intro posted in {channel}",
         }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            f"{SLACK_API}/chat.postMessage",
-            headers=_headers(),
-            json={"channel": channel, "text": message, "mrkdwn": True},
-        )
-        data = resp.json()
-        return {"success": data.get("ok", False), "error": data.get("error")}
+    fun_line = f"\n🎯 *Fun fact:* {fun_fact}" if fun_fact else ""
+    message = _INTRO_TEMPLATE.format(name=name, role=role, team=team, fun_line=fun_line)
+
+    resp = await _request(
+        "POST",
+        "/chat.postMessage",
+        content=orjson.dumps({"channel": channel, "text": message, "mrkdwn": True}),
+    )
+    data = orjson.loads(resp.content)
+    return {"success": data.get("ok", False), "error": data.get("error")}
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Timestamp shared by every model built inside one ``request_time()`` block,
+# so records created in the same onboarding flow agree on "now".
+_request_now: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+
+def now() -> datetime:
+    """The enclosing request's timestamp, or the wall clock outside one."""
+    return _request_now.get() or datetime.now()
+
+
+@contextmanager
+def request_time():
+    """Pin ``now()`` to a single timestamp for the duration of the block."""
+    token = _request_now.set(datetime.now())
+    try:
+        yield
+    finally:
+        _request_now.reset(token)
 
 
 class TaskStatus(str, Enum):
@@ -20,7 +42,7 @@ class TaskStatus(str, Enum):
 
 class OnboardingTask(BaseModel):
     """A single onboarding task."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = Field(default_factory=partial(secrets.token_hex, 4))
     name: str
     description: str
     category: str  # github, slack, gdrive, general
@@ -31,15 +53,17 @@ class OnboardingTask(BaseModel):
 
 class Employee(BaseModel):
     """A new hire being onboarded."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    model_config = ConfigDict(frozen=True)  # Immutable once created; hashable
+
+    id: str = Field(default_factory=partial(secrets.token_hex, 4))
     name: str
     email: str
     role: str
     team: str
     github_username: Optional[str] = None
-    start_date: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
+    start_date: str = Field(default_factory=lambda: now().strftime("%Y-%m-%d"))
     avatar_url: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=now)
 
 
 class OnboardingStatus(BaseModel):
@@ -47,17 +71,65 @@ class OnboardingStatus(BaseModel):
     employee: Employee
     tasks: list[OnboardingTask] = []
     progress_percent: float = 0.0
-    started_at: datetime = Field(default_factory=datetime.now)
+    started_at: datetime = Field(default_factory=now)
     completed_at: Optional[datetime] = None
 
+    # Running task count per status, kept in step by add_tasks/mark_task
+    _counts: dict[TaskStatus, int] = PrivateAttr(
+        default_factory=lambda: dict.fromkeys(TaskStatus, 0)
+    )
+    # Lookup indexes over ``tasks``, kept in step by add_tasks
+    _by_id: dict[str, OnboardingTask] = PrivateAttr(default_factory=dict)
+    _by_category: dict[str, list[OnboardingTask]] = PrivateAttr(default_factory=dict)
+    # Bumped on every change made through add_tasks/mark_task
+    _revision: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context) -> None:
+        self._index(self.tasks)
+
+    def _index(self, tasks: list[OnboardingTask]):
+        for t in tasks:
+            self._by_id[t.id] = t
+            self._by_category.setdefault(t.category, []).append(t)
+            self._counts[t.status] += 1
+
+    @property
+    def revision(self) -> int:
+        """Change counter, for callers caching data derived from this status."""
+        return self._revision
+
+    def count(self, status: TaskStatus) -> int:
+        """Number of tasks currently in ``status``."""
+        return self._counts[status]
+
+    def get_task(self, task_id: str) -> Optional[OnboardingTask]:
+        return self._by_id.get(task_id)
+
+    def tasks_in(self, category: str) -> list[OnboardingTask]:
+        return self._by_category.get(category, [])
+
+    def add_tasks(self, tasks: list[OnboardingTask]):
+        self.tasks.extend(tasks)
+        self._index(tasks)
+        self._revision += 1
+        self.update_progress()
+
+    def mark_task(self, task: OnboardingTask, new_status: TaskStatus):
+        """Move a task to a new status, keeping the status counts in sync."""
+        self._counts[task.status] -= 1
+        self._counts[new_status] += 1
+        task.status = new_status
+        self._revision += 1
+        self.update_progress()
+
     def update_progress(self):
         if not self.tasks:
             self.progress_percent = 0.0
             return
-        done = sum(1 for t in self.tasks if t.status == TaskStatus.COMPLETED)
-        self.progress_percent = round((done / len(self.tasks)) * 100, 1)
+        done = self._counts[TaskStatus.COMPLETED]
+        self.progress_percent = round(done * 100.0 / len(self.tasks), 1)
         if self.progress_percent == 100.0 and not self.completed_at:
-            self.completed_at = datetime.now()
+            self.completed_at = now()
 
 
 class OnboardingRequest(BaseModel):
@@ -16,16 +16,22 @@ Tools:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import logging
 import os
+import re
+import sys
+from contextlib import asynccontextmanager
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import orjson
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from models import Employee, OnboardingTask, TaskStatus
+from models import Employee, OnboardingStatus, OnboardingTask, TaskStatus, request_time
 from store import store
 from integrations import github_integration, slack_integration, gdrive_integration
 
@@ -40,39 +46,103 @@ logger = logging.getLogger("onboard.server")
 # ── Load workflow templates ──────────────────────────────────────────
 
 WORKFLOWS_DIR = Path(__file__).parent.parent / "workflows"
+# Scanned once at startup: adding or removing a workflow file needs a restart;
+# edits to existing files are still picked up via their mtimes.
+_AVAILABLE_WORKFLOWS: dict[str, Path] = {p.stem: p for p in WORKFLOWS_DIR.glob("*.json")}
 
 
+_DIRECT_ROLES = frozenset({"engineering", "design", "general"})
+# Common job title mappings
+_ENGINEERING_RE = re.compile(r"engineer|developer|sre|devops|backend|frontend|fullstack|swe")
+_DESIGN_RE = re.compile(r"design|ux|ui|graphic|illustrat")
+
+
+@functools.lru_cache(maxsize=256)
 def _normalize_role(role: str) -> str:
     """Map job titles to workflow file names."""
     role_lower = role.lower().strip()
     # Direct match
-    if role_lower in ("engineering", "design", "general"):
+    if role_lower in _DIRECT_ROLES:
         return role_lower
-    # Common job title mappings
-    engineering_keywords = ["engineer", "developer", "sre", "devops", "backend", "frontend", "fullstack", "swe"]
-    design_keywords = ["design", "ux", "ui", "graphic", "illustrat"]
-    for kw in engineering_keywords:
-        if kw in role_lower:
-            return "engineering"
-    for kw in design_keywords:
-        if kw in role_lower:
-            return "design"
+    if _ENGINEERING_RE.search(role_lower):
+        return "engineering"
+    if _DESIGN_RE.search(role_lower):
+        return "design"
     return "general"
 
 
+def _workflow_mtime_ns(name: str) -> int:
+    """Modification time of a workflow file, or 0 if it doesn't exist."""
+    path = _AVAILABLE_WORKFLOWS.get(name)
+    if path is None:
+        return 0
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=32)
+def _read_workflow(path_str: str, mtime_ns: int) -> dict:
+    """Parse a workflow file. Keyed on mtime so edits on disk are picked up."""
+    return orjson.loads(Path(path_str).read_bytes())
+
+
 def _load_workflow(role: str) -> dict:
-    """Load a workflow template by role, falling back to 'general'."""
+    """Load a workflow template by role, falling back to 'general'.
+
+    The parsed dict is cached and shared between callers — don't mutate it.
+    """
     normalized = _normalize_role(role)
     for name in [normalized, "general"]:
-        path = WORKFLOWS_DIR / f"{name}.json"
-        if path.exists():
-            return json.loads(path.read_text())
+        path = _AVAILABLE_WORKFLOWS.get(name)
+        if path is None:
+            continue
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        return _read_workflow(str(path), mtime_ns)
     return {"tasks": [], "channels": [], "docs": [], "repos": []}
 
 
-def _merge_workflows(role: str) -> dict:
-    """Merge role-specific workflow with the general workflow."""
+def _workflow_key(role: str) -> tuple[str, int, int]:
+    """Cache key for a role's merged workflow: normalized role plus file mtimes."""
     normalized = _normalize_role(role)
+    return normalized, _workflow_mtime_ns("general"), _workflow_mtime_ns(normalized)
+
+
+@functools.lru_cache(maxsize=32)
+def _task_templates(
+    normalized: str, general_mtime_ns: int, role_mtime_ns: int
+) -> tuple[tuple[str, str, str], ...]:
+    """Interned ``(name, description, category)`` for each task of a merged workflow."""
+    workflow = _merge_workflows_cached(normalized, general_mtime_ns, role_mtime_ns)
+    return tuple(
+        (sys.intern(t["name"]), sys.intern(t["description"]), sys.intern(t["category"]))
+        for t in workflow.get("tasks", [])
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _checklist(normalized: str, general_mtime_ns: int, role_mtime_ns: int) -> dict:
+    """The checklist fields of a merged workflow (shared result — don't mutate)."""
+    workflow = _merge_workflows_cached(normalized, general_mtime_ns, role_mtime_ns)
+    return {
+        "tasks": workflow.get("tasks", []),
+        "channels": workflow.get("channels", []),
+        "docs": workflow.get("docs", []),
+        "repos": workflow.get("repos", []),
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _merge_workflows_cached(normalized: str, general_mtime_ns: int, role_mtime_ns: int) -> dict:
+    """Merge role-specific workflow with the general workflow.
+
+    Call with ``*_workflow_key(role)``. Results are cached per role and
+    workflow-file mtimes — don't mutate them.
+    """
     general = _load_workflow("general")
 
     # If the role IS general, no merge needed
@@ -81,27 +151,40 @@ def _merge_workflows(role: str) -> dict:
 
     role_wf = _load_workflow(normalized)
 
-    # Deduplicate tasks by name
-    seen_names = set()
-    merged_tasks = []
-    for t in general.get("tasks", []) + role_wf.get("tasks", []):
-        if t["name"] not in seen_names:
-            seen_names.add(t["name"])
-            merged_tasks.append(t)
+    # Deduplicate tasks by name (first occurrence wins), keeping order
+    merged_tasks: dict[str, dict] = {}
+    for t in chain(general.get("tasks", ()), role_wf.get("tasks", ())):
+        merged_tasks.setdefault(t["name"], t)
+
+    def _union(key: str) -> list:
+        return list(dict.fromkeys(chain(general.get(key, ()), role_wf.get(key, ()))))
 
     return {
-        "tasks": merged_tasks,
-        "channels": list(set(general.get("channels", []) + role_wf.get("channels", []))),
-        "docs": list(set(general.get("docs", []) + role_wf.get("docs", []))),
+        "tasks": list(merged_tasks.values()),
+        "channels": _union("channels"),
+        "docs": _union("docs"),
         "repos": role_wf.get("repos", []),
     }
 
 
 # ── FastMCP Server ───────────────────────────────────────────────────
 
+
+@asynccontextmanager
+async def _lifespan(app):
+    """Flush pending store writes and close the shared HTTP clients on shutdown."""
+    try:
+        yield
+    finally:
+        store.flush()
+        await slack_integration.aclose()
+        await github_integration.aclose()
+
+
 mcp = FastMCP(
     "Onboarding Agent",
     instructions="AI Employee Onboarding Agent — automates new hire setup across GitHub, Slack, and Google Drive",
+    lifespan=_lifespan,
 )
 
 
@@ -141,89 +224,47 @@ async def _onboard_new_hire_impl(
     github_username: Optional[str] = None,
 ) -> dict:
     """Core onboarding logic shared by MCP tool and REST API."""
-    logger.info(f"🚀 Starting onboarding for {name} ({role}, {team})")
-
-    # 1. Create employee record
-    employee = Employee(
-        name=name,
-        email=email,
-        role=role,
-        team=team,
-        github_username=github_username,
-    )
-    store.add_employee(employee)
+    logger.info("🚀 Starting onboarding for %s (%s, %s)", name, role, team)
+
+    # 1. Create employee record (employee and status share one timestamp)
+    with request_time():
+        employee = Employee(
+            name=name,
+            email=email,
+            role=role,
+            team=team,
+            github_username=github_username,
+        )
+        store.add_employee(employee)
 
     # 2. Load & merge workflows
-    workflow = _merge_workflows(role)
-
-    # 3. Create tasks from workflow
-    tasks = []
-    for t in workflow.get("tasks", []):
-        tasks.append(OnboardingTask(
-            name=t["name"],
-            description=t["description"],
-            category=t["category"],
-        ))
+    workflow_key = _workflow_key(role)
+    workflow = _merge_workflows_cached(*workflow_key)
+
+    # 3. Create tasks from the role's cached templates (trusted data — skip validation)
+    tasks = [
+        OnboardingTask.model_construct(
+            name=task_name, description=description, category=category
+        )
+        for task_name, description, category in _task_templates(*workflow_key)
+    ]
     store.add_tasks(employee.id, tasks)
 
     results = {"employee_id": employee.id, "name": name, "steps": []}
 
-    # 4. Slack: Welcome DM + channels
-    try:
-        dm_result = await slack_integration.send_welcome_dm(email, name, role, team)
-        results["steps"].append({"step": "slack_welcome_dm", **dm_result})
-        _complete_task_by_category(employee.id, "slack", "Send welcome DM")
-
-        channels = workflow.get("channels", [])
-        if channels:
-            ch_result = await slack_integration.add_to_channels(email, channels)
-            results["steps"].append({"step": "slack_channels", "channels": ch_result})
-            _complete_task_by_category(employee.id, "slack", "Add to team channels")
-
-        intro_result = await slack_integration.post_intro("#general", name, role, team)
-        results["steps"].append({"step": "slack_intro", **intro_result})
-        _complete_task_by_category(employee.id, "slack", "Post intro in #general")
-    except Exception as e:
-        logger.error(f"Slack step failed: {e}")
-        results["steps"].append({"step": "slack", "success": False, "error": str(e)})
-
-    # 5. Google Drive: Share docs
-    try:
-        docs = workflow.get("docs", [])
-        if docs:
-            doc_result = await gdrive_integration.share_documents(email, docs)
-            results["steps"].append({"step": "gdrive_share", "docs": doc_result})
-            _complete_task_by_category(employee.id, "gdrive", "Share documents")
-
-        folder_result = await gdrive_integration.create_personal_folder(email, name, team)
-        results["steps"].append({"step": "gdrive_folder", **folder_result})
-        _complete_task_by_category(employee.id, "gdrive", "Create personal folder")
-    except Exception as e:
-        logger.error(f"Google Drive step failed: {e}")
-        results["steps"].append({"step": "gdrive", "success": False, "error": str(e)})
-
-    # 6. GitHub: Invite & repos (if applicable)
-    if github_username:
-        try:
-            invite_result = await github_integration.invite_to_org(github_username)
-            results["steps"].append({"step": "github_invite", **invite_result})
-            _complete_task_by_category(employee.id, "github", "Invite to GitHub org")
-
-            repos = workflow.get("repos", [])
-            if repos:
-                repo_result = await github_integration.grant_repo_access(github_username, repos)
-                results["steps"].append({"step": "github_repos", "repos": repo_result})
-                _complete_task_by_category(employee.id, "github", "Grant repo access")
-
-            if repos:
-                issue_result = await github_integration.create_setup_issue(
-                    github_username, repos[0]
-                )
-                results["steps"].append({"step": "github_issue", **issue_result})
-                _complete_task_by_category(employee.id, "github", "Create setup issue")
-        except Exception as e:
-            logger.error(f"GitHub step failed: {e}")
-            results["steps"].append({"step": "github", "success": False, "error": str(e)})
+    # 4-6. Slack, Google Drive and GitHub are independent — run them concurrently
+    providers = ("slack", "gdrive", "github")
+    provider_steps = await asyncio.gather(
+        _slack_steps(employee.id, workflow, email, name, role, team),
+        _gdrive_steps(employee.id, workflow, email, name, team),
+        _github_steps(employee.id, workflow, github_username),
+        return_exceptions=True,
+    )
+    for provider, steps in zip(providers, provider_steps):
+        if isinstance(steps, Exception):
+            logger.error("%s steps failed: %s", provider, steps)
+            steps = [{"step": provider, "success": False, "error": str(steps)}]
+        results["steps"].extend(steps)
 
     # 7. Final status
     status = store.get_status(employee.id)
@@ -231,24 +272,111 @@ async def _onboard_new_hire_impl(
         status.update_progress()
         results["progress"] = status.progress_percent
         results["total_tasks"] = len(status.tasks)
-        results["completed_tasks"] = sum(
-            1 for t in status.tasks if t.status == TaskStatus.COMPLETED
-        )
+        results["completed_tasks"] = status.count(TaskStatus.COMPLETED)
 
-    logger.info(f"✅ Onboarding complete for {name} — {results.get('progress', 0)}%")
+    logger.info("✅ Onboarding complete for %s — %s%%", name, results.get("progress", 0))
     return results
 
 
-def _complete_task_by_category(employee_id: str, category: str, name_contains: str):
-    """Helper to mark a task complete by matching category and partial name."""
+async def _no_result():
+    return None
+
+
+# Step -> (task category, lowercased task-name fragment) of the checklist task it completes
+_STEP_TASKS = {
+    "slack_welcome_dm": ("slack", "send welcome dm"),
+    "slack_channels": ("slack", "add to team channels"),
+    "slack_intro": ("slack", "post intro in #general"),
+    "gdrive_share": ("gdrive", "share documents"),
+    "gdrive_folder": ("gdrive", "create personal folder"),
+    "github_invite": ("github", "invite to github org"),
+    "github_repos": ("github", "grant repo access"),
+    "github_issue": ("github", "create setup issue"),
+}
+
+
+def _step_result(employee_id: str, step: str, result, key: Optional[str] = None) -> Optional[dict]:
+    """Turn one integration result into a step entry, completing its task on success."""
+    if result is None:
+        return None
+    if isinstance(result, Exception):
+        logger.error("%s step failed: %s", step, result)
+        return {"step": step, "success": False, "error": str(result)}
+    # Reported failures leave the task open
+    if isinstance(result, dict):
+        if result.get("success") is False:
+            logger.error("%s step failed: %s", step, result.get("error"))
+            return {"step": step, **result}
+    else:  # Per-item batch (channels, docs, repos): any failed item fails the step
+        failed = sum(1 for r in result if r.get("success") is False)
+        if failed:
+            logger.error("%s step failed for %d of %d items", step, failed, len(result))
+            return {"step": step, "success": False, key: result}
+    _complete_task_by_category(employee_id, *_STEP_TASKS[step])
+    return {"step": step, key: result} if key else {"step": step, **result}
+
+
+async def _slack_steps(
+    employee_id: str, workflow: dict, email: str, name: str, role: str, team: str
+) -> list[dict]:
+    """Slack: welcome DM, channel invites and #general intro (run concurrently)."""
+    channels = workflow.get("channels", [])
+    dm_result, ch_result, intro_result = await asyncio.gather(
+        slack_integration.send_welcome_dm(email, name, role, team),
+        slack_integration.add_to_channels(email, channels) if channels else _no_result(),
+        slack_integration.post_intro("#general", name, role, team),
+        return_exceptions=True,
+    )
+    steps = [
+        _step_result(employee_id, "slack_welcome_dm", dm_result),
+        _step_result(employee_id, "slack_channels", ch_result, "channels"),
+        _step_result(employee_id, "slack_intro", intro_result),
+    ]
+    return [s for s in steps if s]
+
+
+async def _gdrive_steps(
+    employee_id: str, workflow: dict, email: str, name: str, team: str
+) -> list[dict]:
+    """Google Drive: share docs and create the personal folder (run concurrently)."""
+    docs = workflow.get("docs", [])
+    doc_result, folder_result = await asyncio.gather(
+        gdrive_integration.share_documents(email, docs) if docs else _no_result(),
+        gdrive_integration.create_personal_folder(email, name, team),
+        return_exceptions=True,
+    )
+    steps = [
+        _step_result(employee_id, "gdrive_share", doc_result, "docs"),
+        _step_result(employee_id, "gdrive_folder", folder_result),
+    ]
+    return [s for s in steps if s]
+
+
+async def _github_steps(
+    employee_id: str, workflow: dict, github_username: Optional[str]
+) -> list[dict]:
+    """GitHub: invite to org, grant repo access, create setup issue (if applicable)."""
+    if not github_username:
+        return []
+
+    result = await github_integration.bootstrap(github_username, workflow.get("repos", []))
+    steps = [
+        _step_result(employee_id, "github_invite", result["org_invite"]),
+        _step_result(employee_id, "github_repos", result.get("repo_access"), "repos"),
+        _step_result(employee_id, "github_issue", result.get("setup_issue")),
+    ]
+    return [s for s in steps if s]
+
+
+def _complete_task_by_category(employee_id: str, category: str, needle: str):
+    """Helper to mark a task complete by category and lowercased partial name."""
     status = store.get_status(employee_id)
     if not status:
         return
-    for task in status.tasks:
-        if task.category == category and name_contains.lower() in task.name.lower():
-            task.status = TaskStatus.COMPLETED
+    for task in status.tasks_in(category):
+        if needle in task.name.lower():
+            store.mark_task_complete(employee_id, task.id)
             break
-    status.update_progress()
 
 
 @mcp.tool()
@@ -266,16 +394,7 @@ async def github_invite_to_org(
         org: GitHub organization name (defaults to GITHUB_ORG env var)
     """
     result = {"username": username}
-    result["org_invite"] = await github_integration.invite_to_org(username, org)
-
-    if repos:
-        result["repo_access"] = await github_integration.grant_repo_access(
-            username, repos, org
-        )
-        result["setup_issue"] = await github_integration.create_setup_issue(
-            username, repos[0], org
-        )
-
+    result.update(await github_integration.bootstrap(username, repos or [], org))
     return result
 
 
@@ -297,13 +416,16 @@ async def slack_send_welcome(
         team: Team name
         channels: List of Slack channels to add them to (e.g., ["#engineering", "#standup"])
     """
-    result = {}
-    result["welcome_dm"] = await slack_integration.send_welcome_dm(email, name, role, team)
-
+    # The DM, channel invites and intro are independent — send them concurrently
+    welcome_dm, channel_results, intro = await asyncio.gather(
+        slack_integration.send_welcome_dm(email, name, role, team),
+        slack_integration.add_to_channels(email, channels) if channels else _no_result(),
+        slack_integration.post_intro("#general", name, role, team),
+    )
+    result = {"welcome_dm": welcome_dm}
     if channels:
-        result["channels"] = await slack_integration.add_to_channels(email, channels)
-
-    result["intro"] = await slack_integration.post_intro("#general", name, role, team)
+        result["channels"] = channel_results
+    result["intro"] = intro
     return result
 
 
@@ -330,15 +452,14 @@ async def gdrive_share_docs(
             "message": "Pass doc_keys to share specific documents.",
         }
 
-    result = {}
-    result["shared"] = await gdrive_integration.share_documents(email, doc_keys)
-
-    if name and team:
-        result["personal_folder"] = await gdrive_integration.create_personal_folder(
-            email, name, team
-        )
+    if not (name and team):
+        return {"shared": await gdrive_integration.share_documents(email, doc_keys)}
 
-    return result
+    shared, personal_folder = await asyncio.gather(
+        gdrive_integration.share_documents(email, doc_keys),
+        gdrive_integration.create_personal_folder(email, name, team),
+    )
+    return {"shared": shared, "personal_folder": personal_folder}
 
 
 @mcp.tool()
@@ -357,7 +478,29 @@ def _check_status_impl(employee_id: str) -> dict:
     status = store.get_status(employee_id)
     if not status:
         return {"error": f"Employee {employee_id} not found"}
+    return _cached_view(_status_views, status, _build_status_view)
+
+
+# employee_id -> (status, revision, view). Views are rebuilt only when the
+# status object is replaced (store reload) or its revision changes.
+_status_views: dict[str, tuple[OnboardingStatus, int, dict]] = {}
+_summary_views: dict[str, tuple[OnboardingStatus, int, dict]] = {}
+
 
+def _cached_view(
+    cache: dict, status: OnboardingStatus, build: Callable[[OnboardingStatus], dict]
+) -> dict:
+    """Return ``build(status)``, reusing the previous result until the status changes."""
+    eid = status.employee.id
+    hit = cache.get(eid)
+    if hit and hit[0] is status and hit[1] == status.revision:
+        return hit[2]
+    view = build(status)
+    cache[eid] = (status, status.revision, view)
+    return view
+
+
+def _build_status_view(status: OnboardingStatus) -> dict:
     return {
         "employee": {
             "id": status.employee.id,
@@ -369,9 +512,9 @@ def _check_status_impl(employee_id: str) -> dict:
         },
         "progress_percent": status.progress_percent,
         "total_tasks": len(status.tasks),
-        "completed_tasks": sum(1 for t in status.tasks if t.status == TaskStatus.COMPLETED),
-        "pending_tasks": sum(1 for t in status.tasks if t.status == TaskStatus.PENDING),
-        "failed_tasks": sum(1 for t in status.tasks if t.status == TaskStatus.FAILED),
+        "completed_tasks": status.count(TaskStatus.COMPLETED),
+        "pending_tasks": status.count(TaskStatus.PENDING),
+        "failed_tasks": status.count(TaskStatus.FAILED),
         "tasks": [
             {
                 "id": t.id,
@@ -393,14 +536,7 @@ async def get_onboarding_checklist(role: str) -> dict:
     Args:
         role: Job role (e.g., "engineering", "design", "general")
     """
-    workflow = _merge_workflows(role)
-    return {
-        "role": role,
-        "tasks": workflow.get("tasks", []),
-        "channels": workflow.get("channels", []),
-        "docs": workflow.get("docs", []),
-        "repos": workflow.get("repos", []),
-    }
+    return {"role": role, **_checklist(*_workflow_key(role))}
 
 
 @mcp.tool()
@@ -433,21 +569,30 @@ async def list_all_employees() -> dict:
 def _list_all_impl() -> dict:
     """Core list logic shared by MCP tool and REST API."""
     statuses = store.get_all_statuses()
+    _prune_views({s.employee.id for s in statuses})
     return {
         "total": len(statuses),
-        "employees": [
-            {
-                "id": s.employee.id,
-                "name": s.employee.name,
-                "role": s.employee.role,
-                "team": s.employee.team,
-                "start_date": s.employee.start_date,
-                "progress_percent": s.progress_percent,
-                "total_tasks": len(s.tasks),
-                "completed_tasks": sum(1 for t in s.tasks if t.status == TaskStatus.COMPLETED),
-            }
-            for s in statuses
-        ],
+        "employees": [_cached_view(_summary_views, s, _build_summary_view) for s in statuses],
+    }
+
+
+def _prune_views(live_ids: set[str]):
+    """Drop cached views for employees no longer in the store (e.g. after a reload)."""
+    for cache in (_status_views, _summary_views):
+        for eid in cache.keys() - live_ids:
+            del cache[eid]
+
+
+def _build_summary_view(s: OnboardingStatus) -> dict:
+    return {
+        "id": s.employee.id,
+        "name": s.employee.name,
+        "role": s.employee.role,
+        "team": s.employee.team,
+        "start_date": s.employee.start_date,
+        "progress_percent": s.progress_percent,
+        "total_tasks": len(s.tasks),
+        "completed_tasks": s.count(TaskStatus.COMPLETED),
     }
 
 
@@ -455,27 +600,86 @@ def _list_all_impl() -> dict:
 # The dashboard needs a simple HTTP endpoint to fetch status
 
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route, Mount
 from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, which emits bytes directly."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 async def api_employees(request):
     data = _list_all_impl()
-    return JSONResponse(data)
+    return ORJSONResponse(data)
 
 
 async def api_employee_status(request):
     eid = request.path_params["employee_id"]
     data = _check_status_impl(eid)
-    return JSONResponse(data)
+    return ORJSONResponse(data)
 
 
 async def api_onboard(request):
-    body = await request.json()
+    body = orjson.loads(await request.body())
     data = await _onboard_new_hire_impl(**body)
-    return JSONResponse(data)
+    return ORJSONResponse(data)
+
+
+# Idle streams check the data file for changes written by another process
+# (e.g. the MCP server in ``sse`` mode) this often
+STREAM_REFRESH_SECONDS = 2.0
+# Idle streams send a comment this often so proxies keep the connection open
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+async def api_stream(request):
+    """Server-Sent Events: one dashboard card per employee as it changes."""
+    queue = store.subscribe()
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        try:
+            while True:
+                try:
+                    first = await asyncio.wait_for(queue.get(), STREAM_REFRESH_SECONDS)
+                except asyncio.TimeoutError:
+                    store.refresh()  # Publishes whatever another process changed
+                    if queue.empty():
+                        if loop.time() - last_sent >= STREAM_KEEPALIVE_SECONDS:
+                            last_sent = loop.time()
+                            yield b": keepalive\n\n"
+                        continue
+                    first = queue.get_nowait()
+                # Coalesce bursts (an onboarding makes several changes at once)
+                changed = [first]
+                while not queue.empty():
+                    changed.append(queue.get_nowait())
+                for eid in dict.fromkeys(changed):
+                    status = store.get_status(eid)
+                    if status:
+                        yield b"data: " + orjson.dumps(_card_view(status), default=str) + b"\n\n"
+                last_sent = loop.time()
+        finally:
+            store.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _card_view(status: OnboardingStatus) -> dict:
+    """Summary plus task list — the shape the dashboard renders per employee."""
+    status_view = _cached_view(_status_views, status, _build_status_view)
+    summary = _cached_view(_summary_views, status, _build_summary_view)
+    return {**summary, "tasks": status_view["tasks"]}
 
 
 # Dashboard static files path
@@ -485,13 +689,14 @@ routes = [
     Route("/api/employees", api_employees),
     Route("/api/employees/{employee_id}", api_employee_status),
     Route("/api/onboard", api_onboard, methods=["POST"]),
+    Route("/api/stream", api_stream),
 ]
 
 # Mount dashboard static files if the directory exists
 if DASHBOARD_DIR.exists():
     routes.append(Mount("/", app=StaticFiles(directory=str(DASHBOARD_DIR), html=True)))
 
-dashboard_app = Starlette(routes=routes)
+dashboard_app = Starlette(routes=routes, lifespan=_lifespan)
 dashboard_app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -503,20 +708,27 @@ dashboard_app.add_middleware(
 # ── Entry Point ─────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import sys
     import uvicorn
 
     mode = sys.argv[1] if len(sys.argv) > 1 else "mcp"
     port = int(os.getenv("PORT", "8080"))
 
     if mode == "api":
-        # Run REST API + Dashboard (used in Docker and Railway)
-        logger.info(f"🌐 Starting API + Dashboard server on port {port}")
-        uvicorn.run(dashboard_app, host="0.0.0.0", port=port)
+        # Run REST API + Dashboard (used in Docker and Railway). uvicorn's default
+        # loop="auto" already runs on uvloop when it is installed (uvicorn[standard]).
+        logger.info("🌐 Starting API + Dashboard server on port %s", port)
+        # Dashboard event streams never end on their own — don't wait on them forever
+        uvicorn.run(dashboard_app, host="0.0.0.0", port=port, timeout_graceful_shutdown=5)
     elif mode == "sse":
         # Run as MCP server with Streamable HTTP transport (for Archestra Remote MCP)
         mcp_port = int(os.getenv("MCP_PORT", "8000"))
-        logger.info(f"🤖 Starting Onboarding MCP Server (Streamable HTTP on port {mcp_port})")
+        # mcp.run starts its own event loop, so opt into uvloop here when available
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+        logger.info("🤖 Starting Onboarding MCP Server (Streamable HTTP on port %s)", mcp_port)
         mcp.run(transport="streamable-http", host="0.0.0.0", port=mcp_port)
     else:
         # Run as MCP server with stdio (default)
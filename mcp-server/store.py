@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+from pydantic import TypeAdapter
+
 from models import Employee, OnboardingStatus, OnboardingTask, TaskStatus
 
+# Encodes/decodes the whole persisted file in pydantic-core, with no
+# intermediate dict round-trip through the stdlib json module.
+_STATUSES_ADAPTER = TypeAdapter(dict[str, OnboardingStatus])
+_STATUS_ADAPTER = TypeAdapter(OnboardingStatus)
+
+# Mutations within this window are coalesced into a single write
+SAVE_DEBOUNCE_SECONDS = 0.1
+# Read paths check the data file for outside changes at most this often
+RELOAD_CHECK_SECONDS = 0.5
+# Pretty-print the data file only when debugging
+_JSON_INDENT = 2 if os.getenv("ONBOARD_DEBUG") else None
+
 
 class OnboardingStore:
     """Thread-safe in-memory store with optional JSON persistence."""
@@ -21,6 +39,17 @@ class OnboardingStore:
             "ONBOARD_DATA_PATH", "data/onboarding.json"
         )
         self._last_mtime: float = 0  # Track file modification time
+        self._dirty = False  # In-memory changes not yet written to disk
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop owning the timer
+        # Debounced writes run on one thread, so they land on disk in order
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="onboard-store")
+        self._pending_write: Optional[Future] = None
+        # employee_id -> (status, revision, JSON bytes) for unchanged statuses
+        self._fragments: dict[str, tuple[OnboardingStatus, int, bytes]] = {}
+        # Live-update listeners; each receives the IDs of changed employees
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._next_reload_check: float = 0  # time.monotonic() deadline
         self._load()
 
     # ── Employee Management ──────────────────────────────────────────
@@ -29,6 +58,7 @@ class OnboardingStore:
         self._employees[employee.id] = employee
         self._statuses[employee.id] = OnboardingStatus(employee=employee)
         self._save()
+        self._publish(employee.id)
         return employee
 
     def get_employee(self, employee_id: str) -> Optional[Employee]:
@@ -44,39 +74,36 @@ class OnboardingStore:
     def add_tasks(self, employee_id: str, tasks: list[OnboardingTask]):
         status = self._statuses.get(employee_id)
         if status:
-            status.tasks.extend(tasks)
-            status.update_progress()
+            status.add_tasks(tasks)
             self._save()
+            self._publish(employee_id)
 
     def mark_task_complete(
         self, employee_id: str, task_id: str, details: Optional[str] = None
     ) -> Optional[OnboardingTask]:
         status = self._statuses.get(employee_id)
-        if not status:
+        task = status.get_task(task_id) if status else None
+        if not task:
             return None
-        for task in status.tasks:
-            if task.id == task_id:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now()
-                task.details = details
-                status.update_progress()
-                self._save()
-                return task
-        return None
+        status.mark_task(task, TaskStatus.COMPLETED)
+        task.completed_at = datetime.now()
+        task.details = details
+        self._save()
+        self._publish(employee_id)
+        return task
 
     def mark_task_failed(
         self, employee_id: str, task_id: str, details: Optional[str] = None
     ) -> Optional[OnboardingTask]:
         status = self._statuses.get(employee_id)
-        if not status:
+        task = status.get_task(task_id) if status else None
+        if not task:
             return None
-        for task in status.tasks:
-            if task.id == task_id:
-                task.status = TaskStatus.FAILED
-                task.details = details
-                self._save()
-                return task
-        return None
+        status.mark_task(task, TaskStatus.FAILED)
+        task.details = details
+        self._save()
+        self._publish(employee_id)
+        return task
 
     # ── Status ───────────────────────────────────────────────────────
 
@@ -88,40 +115,127 @@ class OnboardingStore:
         self._reload()
         return list(self._statuses.values())
 
+    # ── Change Notifications ─────────────────────────────────────────
+
+    def subscribe(self) -> asyncio.Queue[str]:
+        """Register a listener queue that receives the ID of each changed employee."""
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[str]):
+        self._subscribers.discard(queue)
+
+    def refresh(self):
+        """Pick up changes another process wrote to the data file (rate-limited)."""
+        self._reload()
+
+    def _publish(self, employee_id: str):
+        for queue in self._subscribers:
+            queue.put_nowait(employee_id)
+
     # ── Persistence ──────────────────────────────────────────────────
 
     def _save(self):
+        """Mark the store dirty and schedule a debounced write."""
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()  # No event loop to debounce on — write now
+            return
+        if self._flush_handle is not None and self._flush_loop is not loop:
+            # The timer belongs to another (usually already closed) loop and may
+            # never fire — write everything now rather than waiting on it
+            self.flush()
+            return
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(SAVE_DEBOUNCE_SECONDS, self._flush_in_background)
+            self._flush_loop = loop
+
+    def _flush_in_background(self):
+        """Serialize on the event loop, then hand the disk write to the writer thread."""
+        self._flush_handle = None
+        self._flush_loop = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        data = self._serialize()
+        self._pending_write = self._writer.submit(self._write, data)
+
+    def flush(self):
+        """Write pending changes to disk now, blocking until done (startup/shutdown)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+        if self._pending_write is not None:
+            self._pending_write.result()  # Let the older write land first
+            self._pending_write = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._write(self._serialize())
+
+    def _serialize(self) -> bytes:
+        """Encode the store, re-serializing only statuses changed since the last write."""
+        if _JSON_INDENT:
+            return _STATUSES_ADAPTER.dump_json(self._statuses, indent=_JSON_INDENT)
+        fragments = {}
+        for eid, status in self._statuses.items():
+            hit = self._fragments.get(eid)
+            if hit is None or hit[0] is not status or hit[1] != status.revision:
+                hit = (status, status.revision, _STATUS_ADAPTER.dump_json(status))
+            fragments[eid] = hit
+        self._fragments = fragments  # Drops entries for statuses no longer stored
+        return b"{" + b",".join(
+            orjson.dumps(eid) + b":" + frag for eid, (_, _, frag) in fragments.items()
+        ) + b"}"
+
+    def _write(self, data: bytes):
+        """Write the serialized store atomically via a temp file."""
         try:
             path = Path(self._persist_path)
             path.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                eid: status.model_dump(mode="json")
-                for eid, status in self._statuses.items()
-            }
-            path.write_text(json.dumps(data, indent=2, default=str))
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._last_mtime = path.stat().st_mtime  # Don't reload our own write
         except Exception:
             pass  # Non-critical — in-memory is the source of truth
 
     def _load(self):
+        """Replace in-memory state with the file's contents (kept as-is on error)."""
         try:
             path = Path(self._persist_path)
             if path.exists():
-                self._last_mtime = path.stat().st_mtime
-                data = json.loads(path.read_text())
-                for eid, status_data in data.items():
-                    status = OnboardingStatus(**status_data)
-                    self._statuses[eid] = status
-                    self._employees[eid] = status.employee
+                mtime = path.stat().st_mtime
+                statuses = _STATUSES_ADAPTER.validate_json(path.read_bytes())
+                previous = self._statuses
+                self._statuses = statuses
+                self._employees = {eid: s.employee for eid, s in statuses.items()}
+                self._last_mtime = mtime
+                # Let live listeners know what another process changed
+                for eid, status in statuses.items():
+                    old = previous.get(eid)
+                    if old is None or old.employee != status.employee or old.tasks != status.tasks:
+                        self._publish(eid)
         except Exception:
-            pass  # Start fresh
+            pass  # Unreadable file — keep current state
 
     def _reload(self):
         """Reload from disk if the file was modified by another process."""
+        if self._flush_loop is not None and self._flush_loop.is_closed():
+            self.flush()  # Its loop closed before the debounced write fired
+        if self._dirty or (self._pending_write and not self._pending_write.done()):
+            return  # Unwritten local changes are newer than the file
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + RELOAD_CHECK_SECONDS
         try:
             path = Path(self._persist_path)
             if path.exists() and path.stat().st_mtime > self._last_mtime:
-                self._employees.clear()
-                self._statuses.clear()
                 self._load()
         except Exception:
             pass
@@ -129,3 +243,4 @@ class OnboardingStore:
 
 # Singleton instance
 store = OnboardingStore()
+atexit.register(store.flush)